@@ -2,6 +2,7 @@
 import streamlit as st
 import pandas as pd
 from src.analyser import DataAnalyser
+from src.data_loader import load_csv
 from src.report_generator import ReportGenerator
 import os
 
@@ -12,7 +13,7 @@ uploaded_file = st.file_uploader("Choose a CSV file", type="csv")
 
 if uploaded_file is not None:
     try:
-        df = pd.read_csv(uploaded_file)
+        df = load_csv(uploaded_file)
         
         st.subheader("📊 Dataset Preview")
         st.write(df.head())
@@ -23,6 +24,8 @@ if uploaded_file is not None:
         # Basic info
         st.subheader("📈 Basic Information")
         info = analyser.basic_info()
+        # Keep what we display so the report doesn't have to recompute it
+        results = {'basic_info': info}
         col1, col2, col3, col4 = st.columns(4)
         with col1:
             st.metric("Rows", f"{info['shape'][0]:,}")
@@ -46,11 +49,13 @@ if uploaded_file is not None:
         if analyser.numeric_cols:
             st.subheader("🔢 Numerical Summary")
             numeric_summary = analyser.numerical_summary()
+            results['numerical_summary'] = numeric_summary
             st.dataframe(numeric_summary.round(3), use_container_width=True)
             
             # Outliers
             st.subheader("🎯 Outlier Detection")
             outliers = analyser .detect_outliers()
+            results['detect_outliers'] = outliers
             outlier_df = pd.DataFrame([
                 {'Column': col, 'Outlier Count': info['count'], 'Percentage': f"{info['percentage']:.2f}%"}
                 for col, info in outliers.items()
@@ -61,6 +66,7 @@ if uploaded_file is not None:
         if analyser.categorical_cols:
             st.subheader("📝 Categorical Summary")
             categorical_summary = analyser.categorical_summary()
+            results['categorical_summary'] = categorical_summary
 
             for col, summary in categorical_summary.items():
                 with st.expander(f"📊 {col}"):
@@ -81,7 +87,7 @@ if uploaded_file is not None:
         st.subheader("📄 Generate HTML Report")
         if st.button("Generate Comprehensive Report", type="primary"):
             with st.spinner("Generating report..."):
-                report_gen = ReportGenerator(analyser)
+                report_gen = ReportGenerator(analyser, precomputed=results)
                 report_path = report_gen.generate_html_report()
             
             st.success(f"✅ Report generated successfully!")
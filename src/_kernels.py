@@ -0,0 +1,84 @@
+# src/_kernels.py
+import numpy as np
+from numba import config, njit, prange
+
+# Prefer OpenMP for prange: Streamlit calls the kernel from its script threads,
+# and a TBB pool first started off the main thread blocks interpreter shutdown
+config.THREADING_LAYER_PRIORITY = ['omp', 'tbb', 'workqueue']
+
+@njit(cache=True)
+def _quantile(values, q):
+    """Linearly interpolated quantile of NaN-free values (numpy's default method)"""
+    pos = q * (values.size - 1)
+    lo = int(np.floor(pos))
+    frac = pos - lo
+    # Partial sort puts the lo-th order statistic in place without sorting everything
+    part = np.partition(values, lo)
+    lower = part[lo]
+    if frac == 0.0 or lo + 1 >= values.size:
+        return lower
+    upper = part[lo + 1:].min()
+    return lower + (upper - lower) * frac
+
+# Order of the per-column values returned by column_stats
+COLUMN_STATS = ('count', 'mean', 'std', '25%', '50%', '75%')
+
+@njit(parallel=True, cache=True)
+def column_stats(mat):
+    """Summary statistics and IQR outlier counts for every column of a 2D float32/float64 matrix
+    
+    Columns are processed in parallel and missing values (NaN) are skipped. Each column is
+    compacted once into a float64 buffer and every statistic is read from that buffer.
+    Returns (stats, outliers): stats[j] holds COLUMN_STATS for column j (NaN where undefined)
+    and outliers[j] is the number of values outside the 1.5 * IQR fences.
+    """
+    n_rows, n_cols = mat.shape
+    stats = np.full((n_cols, len(COLUMN_STATS)), np.nan)
+    outliers = np.zeros(n_cols, dtype=np.int64)
+    for j in prange(n_cols):
+        # Compact the column into a local buffer, dropping missing values,
+        # and accumulate the sum on the way
+        buf = np.empty(n_rows, dtype=np.float64)
+        m = 0
+        total = 0.0
+        for i in range(n_rows):
+            x = mat[i, j]
+            if not np.isnan(x):
+                buf[m] = x
+                total += x
+                m += 1
+        stats[j, 0] = m
+        if m == 0:
+            continue
+        values = buf[:m]
+        mean = total / m
+        # Second pass over the cache-resident buffer for the centred sum of squares
+        sq_dev = 0.0
+        for i in range(m):
+            d = values[i] - mean
+            sq_dev += d * d
+        lower_q = _quantile(values, 0.25)
+        upper_q = _quantile(values, 0.75)
+        iqr = upper_q - lower_q
+        lower_bound = lower_q - 1.5 * iqr
+        upper_bound = upper_q + 1.5 * iqr
+        count = 0
+        for i in range(m):
+            x = values[i]
+            count += (x < lower_bound) | (x > upper_bound)
+        stats[j, 1] = mean
+        if m > 1:
+            stats[j, 2] = np.sqrt(sq_dev / (m - 1))
+        stats[j, 3] = lower_q
+        stats[j, 4] = _quantile(values, 0.5)
+        stats[j, 5] = upper_q
+        outliers[j] = count
+    return stats, outliers
+
+# Compile ahead of the first upload instead of on it: analyser.py imports this
+# module eagerly, so this runs at app start-up. DataFrame.to_numpy() gives
+# Fortran-ordered matrices, and a single-column one counts as C-contiguous, so
+# warm both layouts for each dtype
+for _dtype in (np.float32, np.float64):
+    for _order in ('C', 'F'):
+        column_stats(np.zeros((4, 2), dtype=_dtype, order=_order))
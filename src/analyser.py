@@ -1,18 +1,78 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
+import polars as pl
+import pyarrow as pa
+import functools
 import warnings
 warnings.filterwarnings('ignore')
 
+from ._kernels import COLUMN_STATS, column_stats
+
+# Rows of the numerical summary, in the order pandas' describe() uses,
+# followed by the extra shape statistics
+SUMMARY_STATS = ('count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max', 'skewness', 'kurtosis')
+
+# Largest magnitudes float32 holds faithfully: every integer up to 2**24 is exact
+FLOAT32_INT_LIMIT = 2 ** 24
+FLOAT32_MAX = np.finfo(np.float32).max
+# float32 rounds values by up to eps times their magnitude; that error must stay
+# below this fraction of a column's spread, or centred statistics lose their digits
+FLOAT32_EPS = np.finfo(np.float32).eps
+FLOAT32_SPREAD_TOLERANCE = 1e-6
+
+def _memoized(method):
+    """Cache a no-argument analysis method's result on the analyser"""
+    @functools.wraps(method)
+    def wrapper(self):
+        if method.__name__ not in self._cache:
+            self._cache[method.__name__] = method(self)
+        return self._cache[method.__name__]
+    return wrapper
+
+def _top_values_plan(frame, col, k=10):
+    """Lazy plan for the k most frequent non-missing values of a Polars column
+    
+    Ties are broken by first appearance, the order pandas' value_counts() gives.
+    """
+    count_col = f'{col}__count'
+    first_col = f'{col}__first'
+    return (
+        frame.lazy()
+        .select(col)
+        .with_row_index(first_col)
+        .drop_nulls(col)
+        .group_by(col)
+        .agg(pl.len().alias(count_col), pl.col(first_col).min())
+        # Keep only the k largest groups instead of sorting every distinct value
+        .top_k(k, by=[count_col, first_col], reverse=[False, True])
+        .sort([count_col, first_col], descending=[True, False])
+        .select(col, count_col)
+    )
+
 class DataAnalyser:
     def __init__(self, df):
-        self.df = df.copy()
-        self.numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-        self.categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
-        self.datetime_cols = df.select_dtypes(include=['datetime64']).columns.tolist()
+        # Shared with the caller rather than copied, so no method may modify self.df
+        self.df = df
+        # Partition columns by dtype kind in one pass over df.dtypes. Arrow-backed
+        # dtypes report the same kinds, except Arrow strings which report 'U'.
+        self.numeric_cols, self.categorical_cols, self.datetime_cols = [], [], []
+        # Positions as well as names, since names may repeat and df[names] would
+        # then select every column sharing one
+        self._numeric_positions, self._categorical_positions = [], []
+        for j, (col, dtype) in enumerate(df.dtypes.items()):
+            kind = dtype.kind
+            if kind in 'iuf':
+                self.numeric_cols.append(col)
+                self._numeric_positions.append(j)
+            elif kind == 'U' or (kind == 'O' and pd.api.types.is_string_dtype(dtype)):
+                self.categorical_cols.append(col)
+                self._categorical_positions.append(j)
+            elif kind == 'M':
+                self.datetime_cols.append(col)
+        # Results are computed once per analyser, which is safe because self.df is never modified
+        self._cache = {}
         
+    @_memoized
     def basic_info(self):
         """Get basic dataset information"""
         return {
@@ -20,49 +80,194 @@ class DataAnalyser:
             'columns': list(self.df.columns),
             'dtypes': self.df.dtypes.to_dict(),
             'memory_usage': self.df.memory_usage(deep=True).sum(),
-            'missing_values': self.df.isnull().sum().to_dict(),
-            'duplicate_rows': self.df.duplicated().sum()
+            'missing_values': self._missing_counts(),
+            'duplicate_rows': self._duplicate_count()
         }
     
+    def _arrow_backed(self):
+        """Whether each column is stored as an Arrow array, in column order"""
+        return [isinstance(dtype, pd.ArrowDtype) for dtype in self.df.dtypes]
+    
+    def _missing_counts(self):
+        """Missing values per column, read from Arrow metadata where possible"""
+        arrow_backed = self._arrow_backed()
+        if not any(arrow_backed):
+            return self.df.isnull().sum().to_dict()
+        # Arrow arrays track their null count, so those columns need no scan
+        counts = {}
+        for j, (col, is_arrow) in enumerate(zip(self.df.columns, arrow_backed)):
+            column = self.df.iloc[:, j]
+            counts[col] = column.array.__arrow_array__().null_count if is_arrow else column.isnull().sum()
+        return counts
+    
+    def _duplicate_count(self):
+        """Number of rows that repeat an earlier row"""
+        arrow_backed = self._arrow_backed()
+        # Arrow tables need unique column names to group by
+        if not arrow_backed or not all(arrow_backed) or not self.df.columns.is_unique:
+            try:
+                return self.df.duplicated().sum()
+            except TypeError:
+                # Unhashable cells such as lists are compared by their text
+                return self.df.astype(str).duplicated().sum()
+        # Count distinct rows with Arrow's multithreaded hash grouping
+        try:
+            table = pa.Table.from_pandas(self.df, preserve_index=False)
+            distinct = table.group_by(table.column_names).aggregate([]).num_rows
+        except (pa.ArrowNotImplementedError, pa.ArrowInvalid, ValueError):
+            # Column types Arrow can't convert or group by
+            return self.df.duplicated().sum()
+        return table.num_rows - distinct
+    
+    @_memoized
+    def _numeric_extremes(self):
+        """Exact minimum and maximum of each numeric column"""
+        numeric = self.df.iloc[:, self._numeric_positions]
+        return (numeric.min().to_numpy(dtype=np.float64, na_value=np.nan),
+                numeric.max().to_numpy(dtype=np.float64, na_value=np.nan))
+    
+    @_memoized
+    def numeric_matrix(self):
+        """Numeric columns as one float matrix, with missing values as NaN
+        
+        The matrix is float32 to halve memory traffic, unless a column holds values
+        float32 can't represent (integers beyond 2**24 or floats beyond its range) or
+        can't resolve (a spread that is tiny next to the values, e.g. timestamps).
+        """
+        lows, highs = self._numeric_extremes()
+        magnitude = np.fmax(np.abs(lows), np.abs(highs))
+        spread = highs - lows
+        numeric = self.df.iloc[:, self._numeric_positions]
+        is_integer = [pd.api.types.is_integer_dtype(dtype) for dtype in numeric.dtypes]
+        limits = np.where(is_integer, FLOAT32_INT_LIMIT, FLOAT32_MAX)
+        # Constant columns have no spread to lose; all-missing ones compare as False
+        unresolved = (spread > 0) & (magnitude * FLOAT32_EPS > spread * FLOAT32_SPREAD_TOLERANCE)
+        dtype = np.float64 if ((magnitude > limits) | unresolved).any() else np.float32
+        return numeric.to_numpy(dtype=dtype, copy=False)
+    
+    @_memoized
+    def _compute_numeric_stats(self):
+        """Scan each numeric column once for summary statistics and IQR outlier counts
+        
+        Returns (numeric_stats, outlier_counts): a dict of statistics per column and an
+        int64 vector of outlier counts in numeric_cols order.
+        """
+        arr = self.numeric_matrix()
+        lows, highs = self._numeric_extremes()
+        # Count, moments, quartiles and outliers for all columns in one parallel kernel call
+        kernel_stats, outlier_counts = column_stats(arr)
+        # Skewness and kurtosis for all columns in one multithreaded Polars pass, on a
+        # frame built by position so repeated names can't shift the results
+        numeric = pl.DataFrame([
+            pl.from_pandas(self.df.iloc[:, j]).alias(str(k)) for k, j in enumerate(self._numeric_positions)
+        ])
+        shape_stats = numeric.select(
+            pl.all().skew(bias=False).name.suffix('__skew'),
+            pl.all().kurtosis(bias=False).name.suffix('__kurt')
+        ).row(0)
+        n_numeric = len(self.numeric_cols)
+        
+        numeric_stats = {}
+        for i, col in enumerate(self.numeric_cols):
+            numeric_stats[col] = dict(zip(COLUMN_STATS, kernel_stats[i]))
+            numeric_stats[col].update({'min': lows[i], 'max': highs[i]})
+            
+            # Same small-sample and constant-column conventions as pandas
+            n = numeric_stats[col]['count']
+            constant = numeric_stats[col]['std'] == 0
+            skewness, kurtosis = shape_stats[i], shape_stats[n_numeric + i]
+            numeric_stats[col]['skewness'] = np.nan if n < 3 else 0.0 if constant else skewness
+            numeric_stats[col]['kurtosis'] = np.nan if n < 4 else 0.0 if constant else kurtosis
+        
+        return numeric_stats, outlier_counts
+    
+    @_memoized
     def numerical_summary(self):
         """Statistical summary of numerical columns"""
         if not self.numeric_cols:
             return None
         
-        summary = self.df[self.numeric_cols].describe()
-        # Add additional statistics
-        summary.loc['skewness'] = self.df[self.numeric_cols].skew()
-        summary.loc['kurtosis'] = self.df[self.numeric_cols].kurtosis()
-        
-        return summary
+        numeric_stats, _ = self._compute_numeric_stats()
+        return pd.DataFrame(
+            {col: [numeric_stats[col][stat] for stat in SUMMARY_STATS] for col in self.numeric_cols},
+            index=list(SUMMARY_STATS),
+            dtype=float
+        )
     
+    @_memoized
     def categorical_summary(self):
         """Summary of categorical columns"""
         if not self.categorical_cols:
             return None
-            
+        
+        n_rows = len(self.df)
+        # Convert column by column: object columns mixing types (e.g. str and int) have no
+        # Arrow equivalent, and lists or dicts become nested Polars values that can't key
+        # a dict, so those keep the pandas path below
+        series, polars_cols, fallback_cols = [], [], []
+        for col, j in zip(self.categorical_cols, self._categorical_positions):
+            try:
+                converted = pl.from_pandas(self.df.iloc[:, j])
+            except (TypeError, pa.ArrowException):
+                fallback_cols.append((col, j))
+                continue
+            if converted.dtype.is_nested():
+                fallback_cols.append((col, j))
+            else:
+                series.append(converted.alias(str(len(series))))
+                polars_cols.append(col)
+        
         cat_summary = {}
-        for col in self.categorical_cols:
+        if series:
+            cats = pl.DataFrame(series)
+            n_cats = len(series)
+            # Distinct and missing counts for every column in a single parallel pass
+            counts = cats.select(
+                [pl.col(name).drop_nulls().n_unique().alias(f'unique_{j}') for j, name in enumerate(cats.columns)] +
+                [pl.col(name).null_count().alias(f'missing_{j}') for j, name in enumerate(cats.columns)]
+            ).row(0)
+            # Polars runs the per-column top-k plans together on its own thread pool
+            top_values = [
+                dict(top.rows())
+                for top in pl.collect_all([_top_values_plan(cats, name) for name in cats.columns])
+            ]
+            
+            missing_percentages = np.array(counts[n_cats:]) * (100.0 / max(n_rows, 1))
+            for j, col in enumerate(polars_cols):
+                cat_summary[col] = {
+                    'unique_count': counts[j],
+                    'top_values': top_values[j],
+                    'missing_percentage': missing_percentages[j]
+                }
+        for col, j in fallback_cols:
+            column = self.df.iloc[:, j]
+            missing_percentage = (column.isnull().sum() / max(n_rows, 1)) * 100
+            try:
+                top = column.value_counts().head(10).to_dict()
+            except TypeError:
+                # Unhashable cells such as lists are counted by their text
+                column = column.dropna().astype(str)
+                top = column.value_counts().head(10).to_dict()
             cat_summary[col] = {
-                'unique_count': self.df[col].nunique(),
-                'top_values': self.df[col].value_counts().head(10).to_dict(),
-                'missing_percentage': (self.df[col].isnull().sum() / len(self.df)) * 100
+                'unique_count': column.nunique(),
+                'top_values': top,
+                'missing_percentage': missing_percentage
             }
-        return cat_summary
+        # Report columns in frame order whichever path summarised them
+        return {col: cat_summary[col] for col in self.categorical_cols}
     
+    @_memoized
     def detect_outliers(self):
         """Detect outliers using IQR method"""
+        if not self.numeric_cols:
+            return {}
+        
+        _, outlier_counts = self._compute_numeric_stats()
+        percentages = outlier_counts * (100.0 / max(len(self.df), 1))
         outliers = {}
-        for col in self.numeric_cols:
-            Q1 = self.df[col].quantile(0.25)
-            Q3 = self.df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            
-            outlier_count = ((self.df[col] < lower_bound) | (self.df[col] > upper_bound)).sum()
+        for col, outlier_count, percentage in zip(self.numeric_cols, outlier_counts, percentages):
             outliers[col] = {
                 'count': outlier_count,
-                'percentage': (outlier_count / len(self.df)) * 100
+                'percentage': percentage
             }
-        return outliers
\ No newline at end of file
+        return outliers
@@ -0,0 +1,20 @@
+# src/data_loader.py
+import pandas as pd
+
+def load_csv(source):
+    """Read a CSV into a DataFrame, preferring the multithreaded pyarrow parser
+    
+    Files pyarrow rejects (e.g. rows missing trailing fields) and files with repeated
+    header names, which pyarrow keeps as-is instead of renaming to a, a.1, are read
+    again with pandas' C parser.
+    """
+    try:
+        df = pd.read_csv(source, engine="pyarrow", dtype_backend="pyarrow")
+        if df.columns.is_unique:
+            return df
+    except pd.errors.ParserError:
+        pass
+    # Uploaded files are read from the start again
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    return pd.read_csv(source)
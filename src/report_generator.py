@@ -1,101 +1,175 @@
 # src/report_generator.py
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import base64
+import hashlib
 from io import BytesIO
 import os
+import tempfile
+
+# Rendered plots and report bodies, keyed by a fingerprint of the data
+CACHE_DIR = os.path.join("outputs", ".cache")
+# Part of every cache key; bump it whenever the rendered plots or HTML change
+CACHE_VERSION = 1
 
 class ReportGenerator:
-    def __init__(self, analyser):
+    def __init__(self, analyser, precomputed=None):
         self.analyser = analyser
         self.df = analyser.df
+        # Analyser results the caller already has, keyed by method name
+        self.precomputed = precomputed or {}
+        # Hashed on first cache access; '' once the data turns out to be unhashable
+        self._fingerprint = None
         
-    def _fig_to_base64(self, fig):
-        """Convert matplotlib figure to base64 string for HTML embedding"""
+    def _hash_dataframe(self, df):
+        """Content hash of a DataFrame's labels, dtypes and values"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((CACHE_VERSION, df.shape, list(df.columns), list(df.dtypes.astype(str)))).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+        return digest.hexdigest()
+    
+    def _cache_path(self, filename):
+        """Cache file for this dataset, or None if the data can't be fingerprinted"""
+        if self._fingerprint is None:
+            try:
+                self._fingerprint = self._hash_dataframe(self.df)
+            except TypeError:
+                # Unhashable cells such as lists; the report is rendered without caching
+                self._fingerprint = ''
+        if not self._fingerprint:
+            return None
+        return os.path.join(CACHE_DIR, f"{self._fingerprint}{filename}")
+    
+    def _read_cache(self, filename):
+        """Return cached bytes for this dataset, or None on a miss"""
+        path = self._cache_path(filename)
+        if path is None or not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+    
+    def _write_cache(self, filename, data):
+        """Store bytes for this dataset, replacing the file atomically"""
+        path = self._cache_path(filename)
+        if path is None:
+            return
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # A unique temp file per write, since concurrent sessions share this process
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    
+    def _fig_to_webp(self, fig):
+        """Render matplotlib figure to WebP bytes"""
         buffer = BytesIO()
-        fig.savefig(buffer, format='png', bbox_inches='tight', dpi=150)
-        buffer.seek(0)
-        image_png = buffer.getvalue()
+        fig.savefig(buffer, format='webp', bbox_inches='tight', dpi=100)
+        image_webp = buffer.getvalue()
         buffer.close()
-        graphic = base64.b64encode(image_png)
-        return graphic.decode('utf-8')
+        return image_webp
+    
+    def _cached_plot(self, name, plot_fn):
+        """Return a plot as base64, only rendering it if it isn't cached on disk"""
+        image_webp = self._read_cache(f"_{name}.webp")
+        if image_webp is None:
+            fig = plot_fn()
+            image_webp = self._fig_to_webp(fig)
+            self._write_cache(f"_{name}.webp", image_webp)
+        return base64.b64encode(image_webp).decode('utf-8')
+    
+    def _new_figure(self, figsize):
+        """Standalone Agg figure, kept out of pyplot's global state so plots can render in parallel"""
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        return fig
+    
+    def _correlation_matrix(self):
+        """Pearson correlation of the numeric columns as a single matrix product"""
+        cols = self.analyser.numeric_cols
+        X = self.analyser.numeric_matrix()
+        if np.isnan(X).any():
+            # Missing values need pandas' pairwise-complete handling
+            return self.df[cols].corr()
+        # Centre and scale with float64 sums, then multiply in the matrix's own precision
+        Xc = X - X.mean(axis=0, dtype=np.float64).astype(X.dtype)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            Xc /= np.sqrt(np.einsum('ij,ij->j', Xc, Xc, dtype=np.float64)).astype(X.dtype)
+        return pd.DataFrame((Xc.T @ Xc).astype(np.float64), index=cols, columns=cols)
+    
+    def _plot_correlation(self):
+        """Correlation heatmap for numeric columns"""
+        import seaborn as sns
+        fig = self._new_figure(figsize=(10, 8))
+        ax = fig.subplots()
+        correlation_matrix = self._correlation_matrix()
+        sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', center=0, ax=ax)
+        ax.set_title('Correlation Matrix')
+        return fig
+    
+    def _plot_distributions(self):
+        """Grid of histograms, one per numeric column"""
+        n_cols = min(3, len(self.analyser.numeric_cols))
+        n_rows = (len(self.analyser.numeric_cols) + n_cols - 1) // n_cols
+        fig = self._new_figure(figsize=(15, 5*n_rows))
+        axes = fig.subplots(n_rows, n_cols, squeeze=False).flatten()
+        # Bin straight from the analyser's numeric matrix instead of going through pandas plotting
+        numeric = self.analyser.numeric_matrix()
+        for i, col in enumerate(self.analyser.numeric_cols):
+            ax = axes[i]
+            values = numeric[:, i]
+            counts, edges = np.histogram(values[~np.isnan(values)], bins=30)
+            ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', alpha=0.7)
+            ax.grid(True)
+            ax.set_title(f'Distribution of {col}')
+            ax.set_xlabel(col)
+            ax.set_ylabel('Frequency')
+        # Hide empty subplots
+        for j in range(len(self.analyser.numeric_cols), len(axes)):
+            axes[j].set_visible(False)
+        fig.tight_layout()
+        return fig
     
     def create_visualizations(self):
         """Create all visualizations and return as base64 strings"""
-        plots = {}
-        # Correlation heatmap for numeric columns
-        if len(self.analyser.numeric_cols) > 1:
-            fig, ax = plt.subplots(figsize=(10, 8))
-            correlation_matrix = self.df[self.analyser.numeric_cols].corr()
-            sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', center=0, ax=ax)
-            ax.set_title('Correlation Matrix')
-            plots['correlation'] = self._fig_to_base64(fig)
-            plt.close(fig)
-        # Distribution plots for numeric columns
-        if self.analyser.numeric_cols:
-            n_cols = min(3, len(self.analyser.numeric_cols))
-            n_rows = (len(self.analyser.numeric_cols) + n_cols - 1) // n_cols
-            fig, axes = plt.subplots(n_rows, n_cols, figsize=(15, 5*n_rows))
-            if n_rows == 1:
-                axes = [axes] if n_cols == 1 else axes
-            else:
-                axes = axes.flatten()
-            for i, col in enumerate(self.analyser.numeric_cols):
-                ax = axes[i] if len(self.analyser.numeric_cols) > 1 else axes
-                self.df[col].hist(bins=30, ax=ax, alpha=0.7)
-                ax.set_title(f'Distribution of {col}')
-                ax.set_xlabel(col)
-                ax.set_ylabel('Frequency')
-            # Hide empty subplots
-            for j in range(len(self.analyser.numeric_cols), len(axes)):
-                axes[j].set_visible(False)
-            plt.tight_layout()
-            plots['distributions'] = self._fig_to_base64(fig)
-            plt.close(fig)
+        # Plotting libraries load on the first report rather than at app start;
+        # Agg is selected before seaborn pulls in pyplot so no GUI backend is probed
+        import matplotlib
+        matplotlib.use('Agg')
+        import seaborn  # loaded here rather than first inside the worker threads
+        # The plots share no state, so render them concurrently
+        pending = {}
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            if len(self.analyser.numeric_cols) > 1:
+                pending['correlation'] = executor.submit(self._cached_plot, 'correlation', self._plot_correlation)
+            if self.analyser.numeric_cols:
+                pending['distributions'] = executor.submit(self._cached_plot, 'distributions', self._plot_distributions)
+        plots = {name: future.result() for name, future in pending.items()}
         return plots
     
-    def generate_html_report(self, output_path=None):
-        """Generate comprehensive HTML report"""
-        if output_path is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_path = f"outputs/eda_report_{timestamp}.html"
-        # Ensure outputs directory exists
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    def _analysis_result(self, name):
+        """Result of an analyser method, reusing a precomputed one when available"""
+        if name in self.precomputed:
+            return self.precomputed[name]
+        return getattr(self.analyser, name)()
+    
+    def _render_body(self):
+        """Render the dataset-dependent sections of the report"""
         # Get analysis results
-        basic_info = self.analyser.basic_info()
-        numeric_summary = self.analyser.numerical_summary()
-        categorical_summary = self.analyser.categorical_summary()
-        outliers = self.analyser.detect_outliers()
+        basic_info = self._analysis_result('basic_info')
+        numeric_summary = self._analysis_result('numerical_summary')
+        categorical_summary = self._analysis_result('categorical_summary')
+        outliers = self._analysis_result('detect_outliers')
         plots = self.create_visualizations()
         
-        # Generate HTML content
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>EDA Report - {datetime.now().strftime("%Y-%m-%d %H:%M")}</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 40px; background-color: #f5f5f5; }}
-                .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 0 10px rgba(0,0,0,0.1); }}
-                h1, h2, h3 {{ color: #333; }}
-                .metric {{ display: inline-block; margin: 10px; padding: 15px; background: #e8f4f8; border-radius: 5px; min-width: 150px; text-align: center; }}
-                .metric-value {{ font-size: 24px; font-weight: bold; color: #2c3e50; }}
-                .metric-label {{ font-size: 14px; color: #7f8c8d; }}
-                table {{ border-collapse: collapse; width: 100%; margin: 20px 0; }}
-                th, td {{ border: 1px solid #ddd; padding: 12px; text-align: left; }}
-                th {{ background-color: #f2f2f2; }}
-                .plot-container {{ text-align: center; margin: 30px 0; }}
-                .plot-container img {{ max-width: 100%; height: auto; border-radius: 8px; box-shadow: 0 4px 8px rgba(0,0,0,0.1); }}
-                .warning {{ background-color: #fff3cd; border: 1px solid #ffeaa7; color: #856404; padding: 10px; border-radius: 5px; margin: 10px 0; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>Automated EDA Report</h1>
-                <p><strong>Generated:</strong> {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
-                
+        parts = [f"""
                 <h2>Dataset Overview</h2>
                 <div>
                     <div class="metric">
@@ -115,72 +189,117 @@ class ReportGenerator:
                         <div class="metric-label">Duplicates</div>
                     </div>
                 </div>
-        """
+        """]
         
         # Add missing values warning if any
         if sum(basic_info['missing_values'].values()) > 0:
-            html_content += """
+            parts.append("""
                 <div class="warning">
                     <strong>Warning:</strong> This dataset contains missing values. Consider data cleaning strategies.
                 </div>
-            """
+            """)
         
         # Numerical summary
         if numeric_summary is not None:
-            html_content += """
+            parts.append("""
                 <h2>Numerical Columns Summary</h2>
                 <div style="overflow-x: auto;">
-            """ + numeric_summary.to_html(classes="") + "</div>"
+            """ + numeric_summary.to_html(classes="") + "</div>")
         
         # Categorical summary
         if categorical_summary:
-            html_content += "<h2>Categorical Columns Summary</h2>"
+            parts.append("<h2>Categorical Columns Summary</h2>")
             for col, summary in categorical_summary.items():
-                html_content += f"""
+                parts.append(f"""
                     <h3>{col}</h3>
                     <p>Unique values: {summary['unique_count']} | Missing: {summary['missing_percentage']:.1f}%</p>
                     <p>Top values:</p>
                     <ul>
-                """
+                """)
                 for value, count in list(summary['top_values'].items())[:5]:
-                    html_content += f"<li>{value}: {count}</li>"
-                html_content += "</ul>"
+                    parts.append(f"<li>{value}: {count}</li>")
+                parts.append("</ul>")
         
         # Outliers section
         if outliers:
-            html_content += "<h2>Outlier Detection</h2><table><tr><th>Column</th><th>Outlier Count</th><th>Percentage</th></tr>"
+            parts.append("<h2>Outlier Detection</h2><table><tr><th>Column</th><th>Outlier Count</th><th>Percentage</th></tr>")
             for col, outlier_info in outliers.items():
-                html_content += f"""
+                parts.append(f"""
                     <tr>
                         <td>{col}</td>
                         <td>{outlier_info['count']}</td>
                         <td>{outlier_info['percentage']:.2f}%</td>
                     </tr>
-                """
-            html_content += "</table>"
+                """)
+            parts.append("</table>")
         
         # Add visualizations
         if 'correlation' in plots:
-            html_content += f"""
+            parts.append(f"""
                 <h2>Correlation Analysis</h2>
                 <div class="plot-container">
-                    <img src="data:image/png;base64,{plots['correlation']}" alt="Correlation Matrix">
+                    <img src="data:image/webp;base64,{plots['correlation']}" alt="Correlation Matrix">
                 </div>
-            """
+            """)
         
         if 'distributions' in plots:
-            html_content += f"""
+            parts.append(f"""
                 <h2>Data Distributions</h2>
                 <div class="plot-container">
-                    <img src="data:image/png;base64,{plots['distributions']}" alt="Data Distributions">
+                    <img src="data:image/webp;base64,{plots['distributions']}" alt="Data Distributions">
                 </div>
-            """
+            """)
+        
+        return "".join(parts)
+    
+    def generate_html_report(self, output_path=None):
+        """Generate comprehensive HTML report"""
+        if output_path is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_path = f"outputs/eda_report_{timestamp}.html"
+        # Ensure outputs directory exists
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        # Reuse the rendered sections if this exact dataset was reported before
+        cached_body = self._read_cache(".html")
+        if cached_body is not None:
+            body_content = cached_body.decode('utf-8')
+        else:
+            body_content = self._render_body()
+            self._write_cache(".html", body_content.encode('utf-8'))
         
-        html_content += """
+        # Generate HTML content
+        header = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>EDA Report - {datetime.now().strftime("%Y-%m-%d %H:%M")}</title>
+            <style>
+                body {{ font-family: Arial, sans-serif; margin: 40px; background-color: #f5f5f5; }}
+                .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 0 10px rgba(0,0,0,0.1); }}
+                h1, h2, h3 {{ color: #333; }}
+                .metric {{ display: inline-block; margin: 10px; padding: 15px; background: #e8f4f8; border-radius: 5px; min-width: 150px; text-align: center; }}
+                .metric-value {{ font-size: 24px; font-weight: bold; color: #2c3e50; }}
+                .metric-label {{ font-size: 14px; color: #7f8c8d; }}
+                table {{ border-collapse: collapse; width: 100%; margin: 20px 0; }}
+                th, td {{ border: 1px solid #ddd; padding: 12px; text-align: left; }}
+                th {{ background-color: #f2f2f2; }}
+                .plot-container {{ text-align: center; margin: 30px 0; }}
+                .plot-container img {{ max-width: 100%; height: auto; border-radius: 8px; box-shadow: 0 4px 8px rgba(0,0,0,0.1); }}
+                .warning {{ background-color: #fff3cd; border: 1px solid #ffeaa7; color: #856404; padding: 10px; border-radius: 5px; margin: 10px 0; }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <h1>Automated EDA Report</h1>
+                <p><strong>Generated:</strong> {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
+                
+        """
+        footer = """
             </div>
         </body>
         </html>
         """
+        html_content = "".join((header, body_content, footer))
         
         # Write HTML file
         with open(output_path, 'w', encoding='utf-8') as f:
@@ -2,13 +2,17 @@
 import pytest
 import pandas as pd
 import numpy as np
+import io
 import sys
 import os
 
-# Add the src directory to the path so we can import our modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Add the project root to the path so we can import the src package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from analyser import DataAnalyser
+from src.analyser import DataAnalyser
+from src.data_loader import load_csv
+from src import report_generator
+from src.report_generator import ReportGenerator
 
 def test_analyser_basic_info():
     """Test basic dataset information extraction"""
@@ -43,6 +47,126 @@ def test_numerical_summary():
     assert 'mean' in summary.index
     assert summary.loc['mean', 'col1'] == 3.0
 
+def test_numerical_summary_matches_pandas():
+    """Test summary statistics agree with pandas describe/skew/kurtosis"""
+    df = pd.DataFrame({
+        'ints': [3, 1, 4, 1, 5, 9, 2, 6],
+        'floats': [2.5, None, 0.1, 7.7, 3.3, None, 1.2, 8.8]
+    })
+    
+    analyser = DataAnalyser(df)
+    summary = analyser.numerical_summary()
+    
+    expected = df.describe()
+    expected.loc['skewness'] = df.skew()
+    expected.loc['kurtosis'] = df.kurtosis()
+    pd.testing.assert_frame_equal(summary, expected)
+
+def test_numerical_summary_degenerate_columns():
+    """Test constant and fully missing columns follow pandas conventions"""
+    df = pd.DataFrame({
+        'constant': [7.0, 7.0, 7.0, 7.0, 7.0],
+        'all_missing': [np.nan] * 5
+    })
+    
+    analyser = DataAnalyser(df)
+    summary = analyser.numerical_summary()
+    outliers = analyser.detect_outliers()
+    
+    assert summary.loc['skewness', 'constant'] == 0.0
+    assert summary.loc['count', 'all_missing'] == 0
+    assert np.isnan(summary.loc['mean', 'all_missing'])
+    assert outliers['constant']['count'] == 0
+    assert outliers['all_missing']['count'] == 0
+
+def test_numeric_matrix():
+    """Test numeric columns are exposed as one float matrix with NaN for missing values"""
+    df = pd.DataFrame({
+        'ints': [1, 2, 3],
+        'text': ['A', 'B', 'C'],
+        'floats': [0.5, None, 2.5]
+    })
+    
+    analyser = DataAnalyser(df)
+    matrix = analyser.numeric_matrix()
+    
+    assert matrix.shape == (3, 2)
+    assert matrix.dtype == np.float32
+    assert np.isnan(matrix[1, 1])
+    assert matrix[2, 0] == 3.0
+
+def test_numeric_matrix_keeps_float64_for_large_integers():
+    """Test integers float32 can't hold exactly keep the matrix in float64"""
+    df = pd.DataFrame({
+        'ids': [1, 2**24 + 1, 3],
+        'values': [0.5, 1.5, 2.5]
+    })
+    
+    analyser = DataAnalyser(df)
+    
+    assert analyser.numeric_matrix().dtype == np.float64
+    assert analyser.numerical_summary().loc['max', 'ids'] == 2**24 + 1
+
+def test_large_offset_small_spread_columns():
+    """Test values far from zero with a small spread, like timestamps, keep their precision"""
+    rng = np.random.default_rng(0)
+    noise = rng.uniform(0, 1, 1000)
+    df = pd.DataFrame({
+        'timestamp': 1.7e9 + rng.uniform(0, 100, 1000),
+        'a': 1e7 + noise,
+        'b': 1e7 + noise + rng.normal(0, 0.1, 1000)
+    })
+    
+    analyser = DataAnalyser(df)
+    summary = analyser.numerical_summary()
+    
+    expected = df.describe()
+    expected.loc['skewness'] = df.skew()
+    expected.loc['kurtosis'] = df.kurtosis()
+    pd.testing.assert_frame_equal(summary, expected)
+    pd.testing.assert_frame_equal(ReportGenerator(analyser)._correlation_matrix(), df.corr())
+
+def test_correlation_matrix_matches_pandas():
+    """Test the matrix-product correlation agrees with DataFrame.corr()"""
+    rng = np.random.default_rng(1)
+    x = rng.standard_normal(200)
+    df = pd.DataFrame({
+        'x': x,
+        'y': 2 * x + rng.standard_normal(200),
+        'counts': rng.integers(0, 50, 200),
+        'label': ['A', 'B'] * 100
+    })
+    
+    correlation = ReportGenerator(DataAnalyser(df))._correlation_matrix()
+    
+    pd.testing.assert_frame_equal(correlation, df[['x', 'y', 'counts']].corr(), rtol=1e-5)
+
+def test_correlation_matrix_constant_column():
+    """Test a constant column correlates as NaN, like DataFrame.corr()"""
+    df = pd.DataFrame({
+        'x': [1.0, 2.0, 3.0, 4.0],
+        'y': [2.0, 1.0, 4.0, 3.0],
+        'constant': [5.0, 5.0, 5.0, 5.0]
+    })
+    
+    correlation = ReportGenerator(DataAnalyser(df))._correlation_matrix()
+    
+    assert correlation.loc[['x', 'y', 'constant'], 'constant'].isna().all()
+    assert correlation.loc['constant'].isna().all()
+    pd.testing.assert_frame_equal(correlation, df.corr(), rtol=1e-5)
+
+def test_correlation_matrix_with_missing_values():
+    """Test missing values fall back to pandas' pairwise-complete correlation"""
+    df = pd.DataFrame({
+        'x': [1.0, 2.0, None, 4.0, 5.0, 6.0],
+        'y': [2.0, 1.0, 4.0, None, 6.0, 5.0],
+        'z': [1.0, 3.0, 2.0, 5.0, 4.0, 6.0]
+    })
+    
+    correlation = ReportGenerator(DataAnalyser(df))._correlation_matrix()
+    
+    pd.testing.assert_frame_equal(correlation, df.corr())
+
 def test_categorical_summary():
     """Test categorical column analysis"""
     df = pd.DataFrame({
@@ -56,6 +180,73 @@ def test_categorical_summary():
     assert summary['category']['unique_count'] == 3
     assert summary['category']['top_values']['A'] == 3
 
+def test_categorical_summary_with_missing_values():
+    """Test missing values are excluded from unique and top value counts"""
+    df = pd.DataFrame({
+        'category': ['A', None, 'B', 'A', None, 'A', 'C', 'B']
+    })
+    
+    analyser = DataAnalyser(df)
+    summary = analyser.categorical_summary()['category']
+    
+    assert summary['unique_count'] == 3
+    assert summary['top_values'] == {'A': 3, 'B': 2, 'C': 1}
+    assert list(summary['top_values']) == ['A', 'B', 'C']
+    assert summary['missing_percentage'] == 25.0
+
+def test_categorical_summary_breaks_ties_by_first_appearance():
+    """Test values with equal counts are listed in the order they first appear"""
+    df = pd.DataFrame({
+        'tied': ['c', 'b', None, 'a', 'b', 'c', 'a', 'd'] + [f'v{i}' for i in range(12)]
+    })
+    
+    top_values = DataAnalyser(df).categorical_summary()['tied']['top_values']
+    
+    assert list(top_values.items()) == [('c', 2), ('b', 2), ('a', 2), ('d', 1)] + [(f'v{i}', 1) for i in range(6)]
+
+def test_categorical_summary_tie_order_is_stable():
+    """Test many tied values give the same first-appearance top values on every run"""
+    rng = np.random.default_rng(0)
+    values = np.array([f'v{i}' for i in range(5000)] * 2, dtype=object)
+    df = pd.DataFrame({'tied': values[rng.permutation(values.size)]})
+    expected = list(pd.unique(df['tied'])[:10])
+    
+    for _ in range(5):
+        assert list(DataAnalyser(df).categorical_summary()['tied']['top_values']) == expected
+
+def test_categorical_summary_batches_columns():
+    """Test top values collected together for several columns stay with their own column, in tie order"""
+    rng = np.random.default_rng(2)
+    columns = {}
+    for prefix, repeats in (('a', 2), ('b', 3), ('c', 4)):
+        values = np.array([f'{prefix}{i}' for i in range(2000)] * repeats + [f'{prefix}_top'] * 5, dtype=object)
+        columns[prefix] = values[rng.permutation(values.size)][:4000]
+    df = pd.DataFrame(columns).astype('string[pyarrow]')
+    
+    summary = DataAnalyser(df).categorical_summary()
+    
+    for col in df.columns:
+        counts = df[col].value_counts()
+        # sorted() is stable, so equal counts keep first-appearance order
+        expected = sorted(pd.unique(df[col]), key=lambda value: -counts[value])[:10]
+        assert list(summary[col]['top_values'].items()) == [(value, counts[value]) for value in expected]
+        assert summary[col]['unique_count'] == df[col].nunique()
+
+def test_categorical_summary_mixed_type_column():
+    """Test object columns Arrow can't convert are summarised like the other columns"""
+    df = pd.DataFrame({
+        'mixed': ['a', 1, 'b', 2.5, None, 'a'],
+        'text': ['x', 'y', 'x', None, 'x', 'z']
+    })
+    
+    summary = DataAnalyser(df).categorical_summary()
+    
+    assert list(summary) == ['mixed', 'text']
+    assert summary['mixed']['unique_count'] == 4
+    assert summary['mixed']['top_values']['a'] == 2
+    assert summary['mixed']['missing_percentage'] == pytest.approx(100 / 6)
+    assert summary['text']['top_values'] == {'x': 3, 'y': 1, 'z': 1}
+
 def test_outlier_detection():
     """Test outlier detection using IQR method"""
     # Create data with clear outliers
@@ -71,6 +262,35 @@ def test_outlier_detection():
     assert outliers['with_outliers']['count'] > 0
     assert outliers['normal_data']['count'] == 0
 
+def test_outlier_detection_with_missing_values():
+    """Test outlier counts match a pandas IQR reference when values are missing"""
+    rng = np.random.default_rng(0)
+    values = rng.standard_normal(500)
+    values[::9] = np.nan
+    values[::50] = 25.0
+    df = pd.DataFrame({'noisy': values})
+    
+    analyser = DataAnalyser(df)
+    outliers = analyser.detect_outliers()
+    
+    Q1, Q3 = df['noisy'].quantile(0.25), df['noisy'].quantile(0.75)
+    IQR = Q3 - Q1
+    expected = ((df['noisy'] < Q1 - 1.5 * IQR) | (df['noisy'] > Q3 + 1.5 * IQR)).sum()
+    assert outliers['noisy']['count'] == expected
+
+def test_outlier_percentages():
+    """Test outlier percentages are relative to all rows, and empty without numeric columns"""
+    df = pd.DataFrame({
+        'values': [1, 2, 3, 4, 5, 6, 7, 100],
+        'letters': ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
+    })
+    
+    outliers = DataAnalyser(df).detect_outliers()
+    
+    assert outliers['values']['count'] == 1
+    assert outliers['values']['percentage'] == 12.5
+    assert DataAnalyser(df[['letters']]).detect_outliers() == {}
+
 def test_column_type_detection():
     """Test that columns are correctly categorised by type"""
     df = pd.DataFrame({
@@ -87,6 +307,95 @@ def test_column_type_detection():
     assert 'categorical' in analyser.categorical_cols
     assert 'datetime' in analyser.datetime_cols
 
+def test_column_type_detection_extension_dtypes():
+    """Test nullable, timezone-aware and boolean columns are categorised like their numpy counterparts"""
+    df = pd.DataFrame({
+        'nullable_int': pd.array([1, None, 3], dtype='Int64'),
+        'text': pd.array(['A', None, 'C'], dtype='string'),
+        'flag': [True, False, True],
+        'timestamp': pd.date_range('2023-01-01', periods=3, tz='UTC')
+    })
+    
+    analyser = DataAnalyser(df)
+    
+    assert analyser.numeric_cols == ['nullable_int']
+    assert analyser.categorical_cols == ['text']
+    assert analyser.datetime_cols == ['timestamp']
+
+def test_arrow_backed_dataframe():
+    """Test frames read with the pyarrow CSV engine are analysed like numpy-backed ones"""
+    csv = io.StringIO("name,score\nA,1.5\nB,\nA,3.0\nC,4.5\n")
+    df = pd.read_csv(csv, engine="pyarrow", dtype_backend="pyarrow")
+    
+    analyser = DataAnalyser(df)
+    
+    assert analyser.numeric_cols == ['score']
+    assert analyser.categorical_cols == ['name']
+    assert analyser.basic_info()['missing_values']['score'] == 1
+    assert analyser.numerical_summary().loc['mean', 'score'] == 3.0
+    assert analyser.categorical_summary()['name']['top_values']['A'] == 2
+
+def test_arrow_backed_missing_and_duplicates():
+    """Test Arrow null counts and hash-based duplicate counting match pandas"""
+    csv = io.StringIO("a,b,c\n1,x,\n1,x,\n,y,2.5\n,y,2.5\n2,,3\n")
+    df = pd.read_csv(csv, engine="pyarrow", dtype_backend="pyarrow")
+    
+    analyser = DataAnalyser(df)
+    info = analyser.basic_info()
+    
+    assert info['missing_values'] == {'a': 2, 'b': 1, 'c': 2}
+    assert info['duplicate_rows'] == 2
+
+def test_arrow_backed_repeated_column_names():
+    """Test duplicate rows are still counted when Arrow-backed columns share a name"""
+    csv = io.StringIO("a,b,c\n1,x,1\n1,x,1\n2,y,1\n")
+    df = pd.read_csv(csv, engine="pyarrow", dtype_backend="pyarrow")
+    df.columns = ['a', 'a', 'c']
+    
+    assert DataAnalyser(df).basic_info()['duplicate_rows'] == 1
+
+def test_repeated_column_names_keep_their_statistics():
+    """Test shape statistics and summaries line up with columns when names repeat"""
+    df = pd.DataFrame({
+        'a': [1.0, 2.0, 3.0, 10.0, 4.0],
+        'b': [5.0, 1.0, 1.0, 1.0, 2.0],
+        'c': [2.0, 9.0, 4.0, 4.0, 1.0],
+        'text': ['A', 'B', 'A', 'C', 'A']
+    })
+    df.columns = ['a', 'a', 'c', 'a']
+    
+    analyser = DataAnalyser(df)
+    summary = analyser.numerical_summary()
+    
+    assert analyser.numeric_matrix().shape == (5, 3)
+    assert summary.loc['skewness', 'c'] == pytest.approx(df.iloc[:, 2].skew())
+    assert summary.loc['kurtosis', 'c'] == pytest.approx(df.iloc[:, 2].kurtosis())
+    assert analyser.categorical_summary()['a']['top_values'] == {'A': 3, 'B': 1, 'C': 1}
+
+def test_load_csv_reads_with_arrow():
+    """Test well-formed files are read into Arrow-backed columns"""
+    df = load_csv(io.BytesIO(b"name,score\nA,1.5\nB,\n"))
+    
+    assert list(df.columns) == ['name', 'score']
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+
+def test_load_csv_renames_repeated_headers():
+    """Test repeated header names are made unique, as pandas' C parser does"""
+    df = load_csv(io.BytesIO(b"a,a,b\n1,2,x\n3,4,y\n1,2,x\n"))
+    analyser = DataAnalyser(df)
+    
+    assert list(df.columns) == ['a', 'a.1', 'b']
+    assert analyser.basic_info()['duplicate_rows'] == 1
+    assert analyser.numerical_summary().loc['mean', 'a.1'] == pytest.approx(8 / 3)
+    assert analyser.detect_outliers()['a']['count'] == 0
+
+def test_load_csv_fills_missing_trailing_fields():
+    """Test rows with missing trailing fields are read with NaN, which pyarrow rejects"""
+    df = load_csv(io.BytesIO(b"a,b,c\n1,2,3\n4,5\n"))
+    
+    assert df.shape == (2, 3)
+    assert df['c'].isna().tolist() == [False, True]
+
 def test_empty_dataframe():
     """Test behaviour with empty dataframe"""
     df = pd.DataFrame()
@@ -133,6 +442,107 @@ def test_duplicate_detection():
     
     assert info['duplicate_rows'] == 2  # Two duplicate rows
 
+def test_input_dataframe_is_shared_not_modified():
+    """Test the analyser works on the caller's frame without copying or changing it"""
+    df = pd.DataFrame({
+        'numbers': [5, 1, None, 4, 100],
+        'letters': ['A', None, 'A', 'C', 'B']
+    })
+    original = df.copy()
+    
+    analyser = DataAnalyser(df)
+    analyser.basic_info()
+    analyser.numerical_summary()
+    analyser.categorical_summary()
+    analyser.detect_outliers()
+    
+    assert analyser.df is df
+    pd.testing.assert_frame_equal(df, original)
+
+def test_results_are_cached():
+    """Test repeated calls reuse the first result instead of recomputing"""
+    df = pd.DataFrame({
+        'numbers': [1, 2, 3, 4, 100],
+        'letters': ['A', 'B', 'A', 'C', 'B']
+    })
+    
+    analyser = DataAnalyser(df)
+    
+    assert analyser.basic_info() is analyser.basic_info()
+    assert analyser.numerical_summary() is analyser.numerical_summary()
+    assert analyser.categorical_summary() is analyser.categorical_summary()
+    assert analyser.detect_outliers() is analyser.detect_outliers()
+
+def test_report_reuses_disk_cache(tmp_path, monkeypatch):
+    """Test a second report on the same data reads the cached body and plots instead of rendering"""
+    cache_dir = tmp_path / 'cache'
+    monkeypatch.setattr(report_generator, 'CACHE_DIR', str(cache_dir))
+    df = pd.DataFrame({
+        'x': [1.0, 2.0, 3.0, 4.0, 50.0],
+        'y': [2.0, 1.0, 4.0, 3.0, 5.0],
+        'letters': ['A', 'B', 'A', 'C', 'B']
+    })
+    
+    first = ReportGenerator(DataAnalyser(df))
+    first_path = first.generate_html_report(str(tmp_path / 'first.html'))
+    cached = sorted(os.listdir(cache_dir))
+    
+    assert [name[len(first._fingerprint):] for name in cached] == ['.html', '_correlation.webp', '_distributions.webp']
+    
+    def fail():
+        raise AssertionError("rendered despite a cache hit")
+    second = ReportGenerator(DataAnalyser(df.copy()))
+    monkeypatch.setattr(second, '_render_body', fail)
+    monkeypatch.setattr(second, '_plot_correlation', fail)
+    monkeypatch.setattr(second, '_plot_distributions', fail)
+    second_path = second.generate_html_report(str(tmp_path / 'second.html'))
+    
+    body = (cache_dir / f'{first._fingerprint}.html').read_text(encoding='utf-8')
+    assert second._fingerprint == first._fingerprint
+    assert body in open(first_path, encoding='utf-8').read()
+    assert body in open(second_path, encoding='utf-8').read()
+    assert second.create_visualizations() == first.create_visualizations()
+    assert sorted(os.listdir(cache_dir)) == cached
+
+def test_report_uses_precomputed_results(tmp_path, monkeypatch):
+    """Test results handed to ReportGenerator are reported instead of being recomputed"""
+    monkeypatch.setattr(report_generator, 'CACHE_DIR', str(tmp_path / 'cache'))
+    df = pd.DataFrame({
+        'x': [1.0, 2.0, 3.0, 4.0],
+        'letters': ['A', 'B', 'A', 'C']
+    })
+    analyser = DataAnalyser(df)
+    precomputed = {
+        'categorical_summary': {
+            'letters': {'unique_count': 42, 'top_values': {'sentinel': 7}, 'missing_percentage': 0.0}
+        }
+    }
+    
+    def fail():
+        raise AssertionError("precomputed result was recomputed")
+    monkeypatch.setattr(analyser, 'categorical_summary', fail)
+    output_path = ReportGenerator(analyser, precomputed=precomputed).generate_html_report(str(tmp_path / 'report.html'))
+    
+    html = open(output_path, encoding='utf-8').read()
+    assert 'Unique values: 42' in html
+    assert '<li>sentinel: 7</li>' in html
+
+def test_report_with_unhashable_cells_skips_cache(tmp_path, monkeypatch):
+    """Test data pandas can't hash, such as list cells, is reported without caching"""
+    cache_dir = tmp_path / 'cache'
+    monkeypatch.setattr(report_generator, 'CACHE_DIR', str(cache_dir))
+    df = pd.DataFrame({
+        'x': [1.0, 2.0, 3.0, 4.0],
+        'tags': [['a'], ['b', 'c'], ['a'], None]
+    })
+    
+    output_path = ReportGenerator(DataAnalyser(df)).generate_html_report(str(tmp_path / 'report.html'))
+    
+    html = open(output_path, encoding='utf-8').read()
+    assert 'Outlier Detection' in html
+    assert "<li>['a']: 2</li>" in html
+    assert not cache_dir.exists()
+
 if __name__ == "__main__":
     # Run tests when script is executed directly
     pytest.main([__file__, "-v"])
\ No newline at end of file